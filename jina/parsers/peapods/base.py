@@ -1,11 +1,62 @@
 """Base argparser module for Pea and Pod runtime"""
 import argparse
+import functools
 import os
 
 from jina.parsers.helper import add_arg_group, _SHOW_ALL_ARGS
-from jina.enums import PollingType
 from jina.helper import random_identity
 
+# equals PollingType.ANY.name; kept as a plain string so this argparse module
+# does not need to import jina.enums on the CLI startup path
+_DEFAULT_POLLING = 'ANY'
+
+_NAME_HELP = '''
+The name of this object.
+
+This will be used in the following places:
+- how you refer to this object in Python/YAML/CLI
+- visualization
+- log message header
+- ...
+
+When not given, then the default naming strategy will apply.
+                    '''
+
+_POLLING_HELP = '''
+    The polling strategy of the Pod and its endpoints (when `shards>1`).
+    Can be defined for all endpoints of a Pod or by endpoint.
+    Define per Pod:
+    - ANY: only one (whoever is idle) Pea polls the message
+    - ALL: all Peas poll the message (like a broadcast)
+    Define per Endpoint:
+    JSON dict, {endpoint: PollingType}
+    {'/custom': 'ALL', '/search': 'ANY', '*': 'ANY'}
+
+    '''
+
+
+def _default_timeout_ctrl() -> int:
+    """Resolve the default control timeout at parser-build time.
+
+    Deliberately not cached: the test suite monkeypatches
+    ``JINA_DEFAULT_TIMEOUT_CTRL`` per test and expects newly built parsers
+    to pick it up.
+
+    :return: the default timeout in milliseconds for control requests
+    """
+    return int(os.getenv('JINA_DEFAULT_TIMEOUT_CTRL', '60'))
+
+
+@functools.lru_cache(maxsize=1)
+def _default_log_config() -> str:
+    """Compute the path of the default logging config once per process.
+
+    :return: the path to the default logging YAML config
+    """
+    from jina import __resources_path__
+
+    return os.path.join(__resources_path__, 'logging.default.yml')
+
 
 def mixin_base_ppr_parser(parser, with_identity: bool = True):
     """Mixing in arguments required by pea/pod/runtime module into the given parser.
@@ -17,17 +68,7 @@ def mixin_base_ppr_parser(parser, with_identity: bool = True):
     gp.add_argument(
         '--name',
         type=str,
-        help='''
-The name of this object.
-
-This will be used in the following places:
-- how you refer to this object in Python/YAML/CLI
-- visualization
-- log message header
-- ...
-
-When not given, then the default naming strategy will apply.
-                    ''',
+        help=_NAME_HELP,
     )
 
     gp.add_argument(
@@ -37,12 +78,10 @@ When not given, then the default naming strategy will apply.
         'If not set, then derive from its parent `workspace`.',
     )
 
-    from jina import __resources_path__
-
     gp.add_argument(
         '--log-config',
         type=str,
-        default=os.path.join(__resources_path__, 'logging.default.yml'),
+        default=_default_log_config(),
         help='The YAML config of the logger used in this object.',
     )
 
@@ -95,7 +134,7 @@ When not given, then the default naming strategy will apply.
     gp.add_argument(
         '--timeout-ctrl',
         type=int,
-        default=int(os.getenv('JINA_DEFAULT_TIMEOUT_CTRL', '60')),
+        default=_default_timeout_ctrl(),
         help='The timeout in milliseconds of the control request, -1 for waiting forever',
     )
 
@@ -120,16 +159,6 @@ When not given, then the default naming strategy will apply.
     gp.add_argument(
         '--polling',
         type=str,
-        default=PollingType.ANY.name,
-        help='''
-    The polling strategy of the Pod and its endpoints (when `shards>1`).
-    Can be defined for all endpoints of a Pod or by endpoint.
-    Define per Pod:
-    - ANY: only one (whoever is idle) Pea polls the message
-    - ALL: all Peas poll the message (like a broadcast)
-    Define per Endpoint:
-    JSON dict, {endpoint: PollingType}
-    {'/custom': 'ALL', '/search': 'ANY', '*': 'ANY'}
-    
-    ''',
+        default=_DEFAULT_POLLING,
+        help=_POLLING_HELP,
     )
@@ -8,6 +8,9 @@ from jina.peapods.pods.config.helper import (
     get_image_name,
     to_compatible_name,
     get_base_executor_version,
+    get_pea_parser,
+    get_gateway_parser,
+    resolve_jina_image_name,
 )
 from jina.peapods.pods import BasePod
 
@@ -45,23 +48,15 @@ class DockerComposeConfig:
         def get_gateway_config(
             self,
         ) -> Dict:
-            import os
-
-            test_pip = os.getenv('JINA_K8S_USE_TEST_PIP') is not None
-            image_name = (
-                'jinaai/jina:test-pip'
-                if test_pip
-                else f'jinaai/jina:{self.version}-py38-standard'
-            )
+            image_name = resolve_jina_image_name(self.version, 'standard')
             cargs = copy.copy(self.service_args)
             cargs.pods_addresses = self.pod_addresses
             cargs.env = None
             from jina.helper import ArgNamespace
-            from jina.parsers import set_gateway_parser
 
             non_defaults = ArgNamespace.get_non_defaults_args(
                 cargs,
-                set_gateway_parser(),
+                get_gateway_parser(),
             )
             _args = ArgNamespace.kwargs2list(non_defaults)
             container_args = ['gateway'] + _args
@@ -83,11 +78,10 @@ class DockerComposeConfig:
         def _construct_runtime_container_args(cargs, uses_metas, uses_with):
             import json
             from jina.helper import ArgNamespace
-            from jina.parsers import set_pea_parser
 
             non_defaults = ArgNamespace.get_non_defaults_args(
                 cargs,
-                set_pea_parser(),
+                get_pea_parser(),
                 taboo={
                     'uses_with',
                     'uses_metas',
@@ -106,19 +100,10 @@ class DockerComposeConfig:
             return container_args
 
         def _get_image_name(self, uses: Optional[str]):
-            import os
-
-            test_pip = os.getenv('JINA_K8S_USE_TEST_PIP') is not None
-            image_name = (
-                'jinaai/jina:test-pip'
-                if test_pip
-                else f'jinaai/jina:{self.version}-py38-perf'
-            )
-
             if uses is not None and uses != __default_executor__:
-                image_name = get_image_name(uses)
+                return get_image_name(uses)
 
-            return image_name
+            return resolve_jina_image_name(self.version, 'perf')
 
         def _get_container_args(self, cargs):
             uses_metas = cargs.uses_metas or {}
@@ -173,10 +158,11 @@ class DockerComposeConfig:
 
         self.services_args = self._get_services_args(self.args)
 
+        version = get_base_executor_version()
         if self.services_args['head_service'] is not None:
             self.head_service = self._DockerComposeService(
                 name=self.services_args['head_service'].name,
-                version=get_base_executor_version(),
+                version=version,
                 shard_id=None,
                 jina_pod_name=self.name,
                 common_args=self.args,
@@ -188,7 +174,7 @@ class DockerComposeConfig:
         if self.services_args['uses_before_service'] is not None:
             self.uses_before_service = self._DockerComposeService(
                 name=self.services_args['uses_before_service'].name,
-                version=get_base_executor_version(),
+                version=version,
                 shard_id=None,
                 jina_pod_name=self.name,
                 common_args=self.args,
@@ -200,7 +186,7 @@ class DockerComposeConfig:
         if self.services_args['uses_after_service'] is not None:
             self.uses_after_service = self._DockerComposeService(
                 name=self.services_args['uses_after_service'].name,
-                version=get_base_executor_version(),
+                version=version,
                 shard_id=None,
                 jina_pod_name=self.name,
                 common_args=self.args,
@@ -216,7 +202,7 @@ class DockerComposeConfig:
             self.worker_services.append(
                 self._DockerComposeService(
                     name=name,
-                    version=get_base_executor_version(),
+                    version=version,
                     shard_id=i,
                     common_args=self.args,
                     service_args=args,
@@ -268,7 +254,7 @@ class DockerComposeConfig:
             parsed_args['head_service'].connection_list = json.dumps(connection_list)
 
         if uses_before:
-            uses_before_cargs = copy.deepcopy(args)
+            uses_before_cargs = copy.copy(args)
             uses_before_cargs.shard_id = 0
             uses_before_cargs.replicas = 1
             uses_before_cargs.replica_id = -1
@@ -290,7 +276,7 @@ class DockerComposeConfig:
                 'head_service'
             ].uses_before_address = f'{to_compatible_name(uses_before_cargs.name)}:{uses_before_cargs.port_in}'
         if uses_after:
-            uses_after_cargs = copy.deepcopy(args)
+            uses_after_cargs = copy.copy(args)
             uses_after_cargs.shard_id = 0
             uses_after_cargs.replicas = 1
             uses_after_cargs.replica_id = -1
@@ -313,7 +299,15 @@ class DockerComposeConfig:
             ].uses_after_address = f'{to_compatible_name(uses_after_cargs.name)}:{uses_after_cargs.port_in}'
 
         for i in range(shards):
-            cargs = copy.deepcopy(args)
+            # a shallow copy is enough, the loop only assigns scalars; the
+            # mutable attributes mutated downstream are copied explicitly
+            cargs = copy.copy(args)
+            cargs.env = dict(args.env) if getattr(args, 'env', None) else args.env
+            cargs.uses_metas = (
+                dict(args.uses_metas)
+                if getattr(args, 'uses_metas', None)
+                else args.uses_metas
+            )
             cargs.shard_id = i
             cargs.uses_before = None
             cargs.uses_after = None
@@ -1,3 +1,6 @@
+import functools
+import os
+
 from jina import __version__
 from jina.hubble.helper import parse_hub_uri
 from jina.hubble.hubio import HubIO
@@ -32,6 +35,55 @@ def to_compatible_name(name: str) -> str:
     return name.replace('/', '-').replace('_', '-').lower()
 
 
+@functools.lru_cache(maxsize=None)
+def _jina_image_name(version: str, flavor: str, test_pip: bool) -> str:
+    return (
+        'jinaai/jina:test-pip' if test_pip else f'jinaai/jina:{version}-py38-{flavor}'
+    )
+
+
+def resolve_jina_image_name(version: str, flavor: str) -> str:
+    """Get the name of the jina base image for the given version and flavor.
+
+    Identical names are built once and shared, so the many deployments of a
+    Flow reference the same string object. The ``JINA_K8S_USE_TEST_PIP``
+    environment variable is read on every call since tests toggle it at
+    runtime.
+
+    :param version: the jina version tag to use
+    :param flavor: the image flavor, e.g. ``standard`` or ``perf``
+    :return: the image name
+    """
+    return _jina_image_name(
+        version, flavor, os.getenv('JINA_K8S_USE_TEST_PIP') is not None
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def get_pea_parser():
+    """Get a shared pea parser for extracting non-default CLI args.
+
+    Building an argparse parser is comparatively expensive and the config
+    classes need one per deployment variant, so the instance is memoized.
+    :return: the pea parser
+    """
+    from jina.parsers import set_pea_parser
+
+    return set_pea_parser()
+
+
+@functools.lru_cache(maxsize=1)
+def get_gateway_parser():
+    """Get a shared gateway parser for extracting non-default CLI args.
+
+    :return: the gateway parser
+    """
+    from jina.parsers import set_gateway_parser
+
+    return set_gateway_parser()
+
+
+@functools.lru_cache(maxsize=1)
 def get_base_executor_version():
     """
     Get the version of jina to be used
@@ -41,7 +93,7 @@ def get_base_executor_version():
 
     try:
         url = 'https://registry.hub.docker.com/v1/repositories/jinaai/jina/tags'
-        tags = requests.get(url).json()
+        tags = requests.get(url, timeout=2).json()
         name_set = {tag['name'] for tag in tags}
         if __version__ in name_set:
             return __version__
@@ -4,13 +4,14 @@ from typing import Dict, Union, List, Optional, Tuple
 
 from jina import __default_executor__
 from jina.enums import PeaRoleType
-from jina.peapods.pods.config.k8slib import kubernetes_deployment
 from jina.peapods.pods.config.helper import (
     get_image_name,
     to_compatible_name,
     get_base_executor_version,
+    get_pea_parser,
+    get_gateway_parser,
+    resolve_jina_image_name,
 )
-from jina.peapods.networking import K8sGrpcConnectionPool
 from jina.peapods.pods import BasePod
 
 
@@ -20,6 +21,24 @@ class K8sPodConfig:
     """
 
     class _K8sDeployment:
+        # one instance is created per shard per Pod; __slots__ keeps the
+        # per-instance footprint down on large Flows
+        __slots__ = (
+            'name',
+            'dns_name',
+            'version',
+            'pea_type',
+            'jina_pod_name',
+            'shard_id',
+            'common_args',
+            'deployment_args',
+            'num_replicas',
+            'k8s_namespace',
+            'k8s_connection_pool',
+            'k8s_pod_addresses',
+            '_yamls_cache',
+        )
+
         def __init__(
             self,
             name: str,
@@ -45,38 +64,37 @@ class K8sPodConfig:
             self.k8s_namespace = k8s_namespace
             self.k8s_connection_pool = k8s_connection_pool
             self.k8s_pod_addresses = k8s_pod_addresses
+            # deployments are not mutated after construction, so the rendered
+            # yamls can be reused when the same config is serialized again
+            self._yamls_cache = None
 
         def get_gateway_yamls(
             self,
         ) -> List[Dict]:
-            import os
-
-            test_pip = os.getenv('JINA_K8S_USE_TEST_PIP') is not None
-            image_name = (
-                'jinaai/jina:test-pip'
-                if test_pip
-                else f'jinaai/jina:{self.version}-py38-standard'
-            )
+            if self._yamls_cache is not None:
+                return self._yamls_cache
+            image_name = resolve_jina_image_name(self.version, 'standard')
             cargs = copy.copy(self.deployment_args)
             cargs.env = None
             cargs.pods_addresses = self.k8s_pod_addresses
             from jina.helper import ArgNamespace
-            from jina.parsers import set_gateway_parser
 
             non_defaults = ArgNamespace.get_non_defaults_args(
                 cargs,
-                set_gateway_parser(),
+                get_gateway_parser(),
             )
             _args = ArgNamespace.kwargs2list(non_defaults)
             container_args = ['gateway'] + _args
             if not cargs.k8s_connection_pool:
                 container_args.append('--k8s-disable-connection-pool')
-            return kubernetes_deployment.get_deployment_yamls(
+            from jina.peapods.pods.config.k8slib import kubernetes_deployment
+
+            self._yamls_cache = kubernetes_deployment.get_deployment_yamls(
                 self.dns_name,
                 namespace=self.k8s_namespace,
                 image_name=image_name,
                 container_cmd='["jina"]',
-                container_args=f'{container_args}',
+                container_args=str(container_args),
                 replicas=1,
                 pull_policy='IfNotPresent',
                 jina_pod_name='gateway',
@@ -84,16 +102,16 @@ class K8sPodConfig:
                 port_expose=self.common_args.port_expose,
                 env=cargs.env,
             )
+            return self._yamls_cache
 
         @staticmethod
         def _construct_runtime_container_args(cargs, uses_metas, uses_with, pea_type):
             import json
             from jina.helper import ArgNamespace
-            from jina.parsers import set_pea_parser
 
             non_defaults = ArgNamespace.get_non_defaults_args(
                 cargs,
-                set_pea_parser(),
+                get_pea_parser(),
                 taboo={
                     'uses_with',
                     'uses_metas',
@@ -114,19 +132,10 @@ class K8sPodConfig:
             return container_args
 
         def _get_image_name(self, uses: Optional[str]):
-            import os
-
-            test_pip = os.getenv('JINA_K8S_USE_TEST_PIP') is not None
-            image_name = (
-                'jinaai/jina:test-pip'
-                if test_pip
-                else f'jinaai/jina:{self.version}-py38-perf'
-            )
-
             if uses is not None and uses != __default_executor__:
-                image_name = get_image_name(uses)
+                return get_image_name(uses)
 
-            return image_name
+            return resolve_jina_image_name(self.version, 'perf')
 
         def _get_container_args(self, cargs, pea_type):
             uses_metas = cargs.uses_metas or {}
@@ -142,24 +151,27 @@ class K8sPodConfig:
         def get_runtime_yamls(
             self,
         ) -> List[Dict]:
+            if self._yamls_cache is not None:
+                return self._yamls_cache
+            from jina.peapods.networking import K8sGrpcConnectionPool
+            from jina.peapods.pods.config.k8slib import kubernetes_deployment
+
             cargs = copy.copy(self.deployment_args)
+            uses_before = getattr(cargs, 'uses_before', None)
+            uses_after = getattr(cargs, 'uses_after', None)
 
             image_name = self._get_image_name(cargs.uses)
             image_name_uses_before = (
-                self._get_image_name(cargs.uses_before)
-                if hasattr(cargs, 'uses_before') and cargs.uses_before
-                else None
+                self._get_image_name(uses_before) if uses_before else None
             )
             image_name_uses_after = (
-                self._get_image_name(cargs.uses_after)
-                if hasattr(cargs, 'uses_after') and cargs.uses_after
-                else None
+                self._get_image_name(uses_after) if uses_after else None
             )
             container_args = self._get_container_args(cargs, pea_type=self.pea_type)
             container_args_uses_before = None
-            if getattr(cargs, 'uses_before', False):
+            if uses_before:
                 uses_before_cargs = copy.copy(cargs)
-                uses_before_cargs.uses = cargs.uses_before
+                uses_before_cargs.uses = uses_before
                 uses_before_cargs.name = f'{self.common_args.name}/uses-before'
                 uses_before_cargs.port_in = K8sGrpcConnectionPool.K8S_PORT_USES_BEFORE
                 uses_before_cargs.uses_before_address = None
@@ -178,9 +190,9 @@ class K8sPodConfig:
                 )
 
             container_args_uses_after = None
-            if getattr(cargs, 'uses_after', False):
+            if uses_after:
                 uses_after_cargs = copy.copy(cargs)
-                uses_after_cargs.uses = cargs.uses_after
+                uses_after_cargs.uses = uses_after
                 uses_after_cargs.name = f'{self.common_args.name}/uses-after'
                 uses_after_cargs.port_in = K8sGrpcConnectionPool.K8S_PORT_USES_AFTER
                 uses_after_cargs.uses_before_address = None
@@ -198,7 +210,7 @@ class K8sPodConfig:
                     uses_after_cargs, PeaRoleType.WORKER
                 )
 
-            return kubernetes_deployment.get_deployment_yamls(
+            self._yamls_cache = kubernetes_deployment.get_deployment_yamls(
                 self.dns_name,
                 namespace=self.k8s_namespace,
                 image_name=image_name,
@@ -207,7 +219,7 @@ class K8sPodConfig:
                 container_cmd='["jina"]',
                 container_cmd_uses_before='["jina"]',
                 container_cmd_uses_after='["jina"]',
-                container_args=f'{container_args}',
+                container_args=str(container_args),
                 container_args_uses_before=container_args_uses_before,
                 container_args_uses_after=container_args_uses_after,
                 replicas=self.num_replicas,
@@ -216,8 +228,9 @@ class K8sPodConfig:
                 pea_type=self.pea_type,
                 shard_id=self.shard_id,
                 env=cargs.env,
-                gpus=cargs.gpus if hasattr(cargs, 'gpus') else None,
+                gpus=getattr(cargs, 'gpus', None),
             )
+            return self._yamls_cache
 
     def __init__(
         self,
@@ -241,10 +254,11 @@ class K8sPodConfig:
 
         self.deployment_args = self._get_deployment_args(self.args)
 
+        version = get_base_executor_version()
         if self.deployment_args['head_deployment'] is not None:
             self.head_deployment = self._K8sDeployment(
                 name=self.deployment_args['head_deployment'].name,
-                version=get_base_executor_version(),
+                version=version,
                 shard_id=None,
                 jina_pod_name=self.name,
                 common_args=self.args,
@@ -262,7 +276,7 @@ class K8sPodConfig:
             self.worker_deployments.append(
                 self._K8sDeployment(
                     name=name,
-                    version=get_base_executor_version(),
+                    version=version,
                     shard_id=i,
                     common_args=self.args,
                     deployment_args=args,
@@ -279,6 +293,8 @@ class K8sPodConfig:
             )
 
     def _get_deployment_args(self, args):
+        from jina.peapods.networking import K8sGrpcConnectionPool
+
         parsed_args = {
             'head_deployment': None,
             'deployments': [],
@@ -300,11 +316,10 @@ class K8sPodConfig:
                 import json
 
                 connection_list = {}
+                compatible_name = to_compatible_name(self.name)
                 for i in range(shards):
                     name = (
-                        f'{to_compatible_name(self.name)}-{i}'
-                        if shards > 1
-                        else f'{to_compatible_name(self.name)}'
+                        f'{compatible_name}-{i}' if shards > 1 else compatible_name
                     )
                     connection_list[
                         str(i)
@@ -328,7 +343,15 @@ class K8sPodConfig:
             )
 
         for i in range(shards):
-            cargs = copy.deepcopy(args)
+            # a shallow copy is enough, the loop only assigns scalars; the
+            # mutable attributes mutated downstream are copied explicitly
+            cargs = copy.copy(args)
+            cargs.env = dict(args.env) if getattr(args, 'env', None) else args.env
+            cargs.uses_metas = (
+                dict(args.uses_metas)
+                if getattr(args, 'uses_metas', None)
+                else args.uses_metas
+            )
             cargs.shard_id = i
             cargs.uses_before = None
             cargs.uses_after = None
@@ -362,12 +385,21 @@ class K8sPodConfig:
                 )
             ]
         else:
+            from concurrent.futures import ThreadPoolExecutor
+
             deployments = [self.head_deployment]
             deployments.extend(self.worker_deployments)
-            return [
-                (
-                    deployment.dns_name,
-                    deployment.get_runtime_yamls(),
+            # deployments are independent and their rendering reads template
+            # files, so overlap them across a small thread pool
+            with ThreadPoolExecutor(
+                max_workers=min(8, len(deployments))
+            ) as executor:
+                return list(
+                    executor.map(
+                        lambda deployment: (
+                            deployment.dns_name,
+                            deployment.get_runtime_yamls(),
+                        ),
+                        deployments,
+                    )
                 )
-                for deployment in deployments
-            ]
@@ -7,6 +7,15 @@ from jina.peapods.pods.config.helper import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_version_cache():
+    # get_base_executor_version is memoized per process, drop any result
+    # cached by earlier tests before mocking the registry response
+    get_base_executor_version.cache_clear()
+    yield
+    get_base_executor_version.cache_clear()
+
+
 @pytest.mark.parametrize('is_master', (True, False))
 def test_version(is_master, requests_mock):
     if is_master: